@@ -312,7 +312,7 @@ def pivot_to_investments(facts_df: pd.DataFrame) -> pd.DataFrame:
     # Group by investment_id and field, take first value
     investments = defaultdict(dict)
 
-    for _, row in facts_df.iterrows():
+    for row in facts_df.to_dict('records'):
         inv_id = row['investment_id']
         if not inv_id:
             continue
@@ -370,16 +370,18 @@ def split_debt_equity(investments_df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.Da
     investments_df = investments_df.copy()
     investments_df['asset_class'] = investments_df.apply(classify_row, axis=1)
 
-    # Add affiliation category from affiliation field
-    investments_df['affiliation_category'] = investments_df.apply(
-        lambda row: get_affiliation_category(row.get('affiliation'), None),
-        axis=1
-    )
+    # Add affiliation category from affiliation field (column-wise, no per-row Series)
+    if 'affiliation' in investments_df.columns:
+        investments_df['affiliation_category'] = investments_df['affiliation'].map(
+            lambda aff: get_affiliation_category(aff, None)
+        )
+    else:
+        investments_df['affiliation_category'] = get_affiliation_category(None, None)
 
     # Split
     debt_df = investments_df[investments_df['asset_class'] == 'Debt'].copy()
     equity_df = investments_df[investments_df['asset_class'] == 'Equity'].copy()
-    unknown_df = investments_df[investments_df['asset_class'] == 'Unknown'].copy()
+    unknown_df = investments_df[investments_df['asset_class'] == 'Unknown']
 
     # Report unknowns
     if len(unknown_df) > 0:
@@ -478,7 +480,7 @@ def extract_affiliated_rollforward(xbrl) -> pd.DataFrame:
     )
 
     # Filter to individual investments
-    individual = combined[combined['investment_id'].notna()].copy()
+    individual = combined[combined['investment_id'].notna()]
 
     if individual.empty:
         # Return aggregate data if no individual positions found
@@ -488,7 +490,7 @@ def extract_affiliated_rollforward(xbrl) -> pd.DataFrame:
 
     # Pivot by investment
     rollforward = defaultdict(dict)
-    for _, row in individual.iterrows():
+    for row in individual.to_dict('records'):
         inv_id = row['investment_id']
         if inv_id:
             field = row['field']
@@ -506,59 +508,60 @@ def extract_portfolio_summary(xbrl, debt_df: pd.DataFrame, equity_df: pd.DataFra
     """Generate portfolio summary statistics."""
     summary = []
     
-    # Totals from extracted data
+    # Totals from extracted data (computed once, reused for the grand totals)
+    debt_totals = debt_df[[c for c in ('fair_value', 'cost') if c in debt_df.columns]].sum()
+    equity_totals = equity_df[[c for c in ('fair_value', 'cost') if c in equity_df.columns]].sum()
+    
     if not debt_df.empty and 'fair_value' in debt_df.columns:
-        debt_fv = debt_df['fair_value'].sum()
-        debt_cost = debt_df['cost'].sum() if 'cost' in debt_df.columns else None
         summary.append({
             'category': 'Asset Class',
             'subcategory': 'Debt Investments',
-            'fair_value': debt_fv,
-            'cost': debt_cost,
+            'fair_value': debt_totals['fair_value'],
+            'cost': debt_totals.get('cost'),
             'count': len(debt_df)
         })
     
     if not equity_df.empty and 'fair_value' in equity_df.columns:
-        equity_fv = equity_df['fair_value'].sum()
-        equity_cost = equity_df['cost'].sum() if 'cost' in equity_df.columns else None
         summary.append({
             'category': 'Asset Class',
             'subcategory': 'Equity Investments',
-            'fair_value': equity_fv,
-            'cost': equity_cost,
+            'fair_value': equity_totals['fair_value'],
+            'cost': equity_totals.get('cost'),
             'count': len(equity_df)
         })
     
     # Industry breakdown
     for df, asset_class in [(debt_df, 'Debt'), (equity_df, 'Equity')]:
         if not df.empty and 'industry' in df.columns and 'fair_value' in df.columns:
-            industry_totals = df.groupby('industry')['fair_value'].sum()
+            industry_groups = df.groupby('industry')
+            industry_totals = industry_groups['fair_value'].sum()
+            industry_counts = industry_groups.size()
             for industry, fv in industry_totals.items():
                 if industry and pd.notna(industry):
                     summary.append({
                         'category': f'Industry ({asset_class})',
                         'subcategory': industry,
                         'fair_value': fv,
-                        'count': len(df[df['industry'] == industry])
+                        'count': industry_counts[industry]
                     })
     
     # Affiliation breakdown
     all_investments = pd.concat([debt_df, equity_df], ignore_index=True) if not debt_df.empty or not equity_df.empty else pd.DataFrame()
     if not all_investments.empty and 'affiliation_category' in all_investments.columns:
-        aff_totals = all_investments.groupby('affiliation_category')['fair_value'].sum()
+        aff_groups = all_investments.groupby('affiliation_category')
+        aff_totals = aff_groups['fair_value'].sum()
+        aff_counts = aff_groups.size()
         for aff, fv in aff_totals.items():
             summary.append({
                 'category': 'Affiliation',
                 'subcategory': aff,
                 'fair_value': fv,
-                'count': len(all_investments[all_investments['affiliation_category'] == aff])
+                'count': aff_counts[aff]
             })
     
     # Grand totals
-    total_fv = (debt_df['fair_value'].sum() if not debt_df.empty and 'fair_value' in debt_df.columns else 0) + \
-               (equity_df['fair_value'].sum() if not equity_df.empty and 'fair_value' in equity_df.columns else 0)
-    total_cost = (debt_df['cost'].sum() if not debt_df.empty and 'cost' in debt_df.columns else 0) + \
-                 (equity_df['cost'].sum() if not equity_df.empty and 'cost' in equity_df.columns else 0)
+    total_fv = debt_totals.get('fair_value', 0) + equity_totals.get('fair_value', 0)
+    total_cost = debt_totals.get('cost', 0) + equity_totals.get('cost', 0)
     
     summary.append({
         'category': 'Total',
@@ -740,15 +743,15 @@ def main():
         print(f"\n{'='*70}")
         print("PORTFOLIO SUMMARY")
         print(f"{'='*70}")
-        for _, row in summary_df.iterrows():
-            if row['category'] == 'Total':
-                print(f"\n{row['subcategory']}:")
-                print(f"  Fair Value: ${row['fair_value']:,.0f}")
-                if pd.notna(row.get('cost')):
-                    print(f"  Cost: ${row['cost']:,.0f}")
-                if pd.notna(row.get('unrealized_gain_loss')):
-                    print(f"  Unrealized Gain/Loss: ${row['unrealized_gain_loss']:,.0f}")
-                print(f"  Position Count: {row['count']}")
+        totals = summary_df[summary_df['category'] == 'Total']
+        for row in totals.to_dict('records'):
+            print(f"\n{row['subcategory']}:")
+            print(f"  Fair Value: ${row['fair_value']:,.0f}")
+            if pd.notna(row.get('cost')):
+                print(f"  Cost: ${row['cost']:,.0f}")
+            if pd.notna(row.get('unrealized_gain_loss')):
+                print(f"  Unrealized Gain/Loss: ${row['unrealized_gain_loss']:,.0f}")
+            print(f"  Position Count: {row['count']}")
     
     print(f"\n{'='*70}")
     print("Extraction complete!")
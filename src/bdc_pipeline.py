@@ -16,7 +16,6 @@ from collections import defaultdict
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from edgar import Company, set_identity
 from src.db_loader import BDCDatabase, classify_asset_class
 from src.classify_industries import classify_industry
 
@@ -140,7 +139,7 @@ def extract_investments_from_xbrl(xbrl) -> pd.DataFrame:
         return pd.DataFrame()
     
     # Filter to facts with investment identifiers
-    inv_facts = all_facts[all_facts[inv_id_col].notna()].copy()
+    inv_facts = all_facts[all_facts[inv_id_col].notna()]
     
     if inv_facts.empty:
         print(f"    No facts with InvestmentIdentifierAxis")
@@ -151,7 +150,7 @@ def extract_investments_from_xbrl(xbrl) -> pd.DataFrame:
     # Pivot: group by investment identifier and collect values for each concept
     investments = defaultdict(dict)
     
-    for _, row in inv_facts.iterrows():
+    for row in inv_facts.to_dict('records'):
         inv_id = row[inv_id_col]
         concept = row['concept']
         value = row['value']
@@ -213,6 +212,8 @@ def extract_investments_from_xbrl(xbrl) -> pd.DataFrame:
 
 def get_bdc_10k(ticker: str, year: Optional[int] = None, amendments: bool = False):
     """Get 10-K filing, optionally excluding amendments."""
+    from edgar import Company
+
     company = Company(ticker)
     filings = company.get_filings(form="10-K", amendments=amendments)
     
@@ -305,7 +306,7 @@ def extract_and_load_bdc(ticker: str, db: BDCDatabase, year: Optional[int] = Non
         )
         
         loaded = 0
-        for _, row in investments_df.iterrows():
+        for row in investments_df.to_dict('records'):
             company_id = db.get_or_create_company(
                 name=row['company_name'],
                 business_desc=None,
@@ -380,8 +381,6 @@ def main():
     parser.add_argument('--reset', action='store_true', help='Reset database')
     args = parser.parse_args()
     
-    set_identity("BDC Analysis Project research@example.com")
-    
     if args.list:
         show_available_bdcs()
         return
@@ -415,6 +414,10 @@ def main():
         
         years = args.years if args.years else [None]
         
+        # edgar is only needed for extraction; --list/--status skip the import
+        from edgar import set_identity
+        set_identity("BDC Analysis Project research@example.com")
+        
         results = []
         total = len(tickers) * len(years)
         
@@ -362,7 +362,7 @@ class BDCDatabase:
             'updated': 0,
         }
         
-        for _, row in df.iterrows():
+        for row in df.to_dict('records'):
             # Get or create BDC
             bdc_ticker = self.get_or_create_bdc(
                 name=row['bdc_name'],